@@ -1 +1,1099 @@
 """Correction methods for the stress-life."""
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from fatpy.data_parsing.material import MaterialProperties
+
+CorrectionFunc = Callable[
+    [NDArray[np.floating], NDArray[np.floating]], NDArray[np.floating]
+]
+MaterialCorrectionFunc = Callable[
+    [NDArray[np.floating], NDArray[np.floating], MaterialProperties],
+    NDArray[np.floating],
+]
+
+try:
+    from numba import njit, prange, vectorize
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import numexpr
+
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)  # type: ignore
+    def _goodman_kernel(
+        amp: NDArray[np.floating],
+        mean: NDArray[np.floating],
+        ultimate_tensile_strength: float,
+        out: NDArray[np.floating],
+    ) -> None:
+        """Single-pass Goodman correction kernel.
+
+        The correction is written as ``amp * uts / (uts - mean)`` rather
+        than ``amp / (1 - mean / uts)``: the divide-free numerator and the
+        single subtract in the denominator lower to fused multiply-add
+        friendly code, leaving one division per element for LLVM to
+        vectorize.
+        """
+        uts = ultimate_tensile_strength
+        for i in prange(amp.size):
+            m = mean[i]
+            if m <= 0.0:
+                out[i] = amp[i]
+            else:
+                out[i] = amp[i] * uts / (uts - m)
+
+    @njit(parallel=True, fastmath=True, cache=True)  # type: ignore
+    def _gerber_kernel(
+        amp: NDArray[np.floating],
+        mean: NDArray[np.floating],
+        ultimate_tensile_strength: float,
+        out: NDArray[np.floating],
+    ) -> None:
+        """Single-pass Gerber correction kernel."""
+        inv_uts = 1.0 / ultimate_tensile_strength
+        inv_uts2 = inv_uts * inv_uts
+        for i in prange(amp.size):
+            m = mean[i]
+            if m <= 0.0:
+                out[i] = amp[i]
+            else:
+                out[i] = amp[i] / (1.0 - m * m * inv_uts2)
+
+    @njit(parallel=True, fastmath=True, cache=True)  # type: ignore
+    def _morrow_kernel(
+        amp: NDArray[np.floating],
+        mean: NDArray[np.floating],
+        fatigue_strength_coefficient: float,
+        out: NDArray[np.floating],
+    ) -> None:
+        """Single-pass Morrow correction kernel.
+
+        Uses the same division-minimizing ``amp * sf / (sf - mean)`` form
+        as the Goodman kernel.
+        """
+        sf = fatigue_strength_coefficient
+        for i in prange(amp.size):
+            m = mean[i]
+            if m <= 0.0:
+                out[i] = amp[i]
+            else:
+                out[i] = amp[i] * sf / (sf - m)
+
+    @njit(parallel=True, fastmath=True, cache=True)  # type: ignore
+    def _all_corrections_kernel(
+        amp: NDArray[np.floating],
+        mean: NDArray[np.floating],
+        ultimate_tensile_strength: float,
+        fatigue_strength_coefficient: float,
+        goodman: NDArray[np.floating],
+        gerber: NDArray[np.floating],
+        swt: NDArray[np.floating],
+        morrow: NDArray[np.floating],
+    ) -> None:
+        """Fused kernel computing all four corrections in one pass.
+
+        Reads each amplitude/mean pair once and writes the four outputs
+        per iteration, cutting the memory traffic of four separate passes
+        to roughly a quarter.
+        """
+        uts = ultimate_tensile_strength
+        inv_uts2 = (1.0 / uts) * (1.0 / uts)
+        sf = fatigue_strength_coefficient
+        for i in prange(amp.size):
+            s = amp[i]
+            m = mean[i]
+            if m <= 0.0:
+                goodman[i] = s
+                gerber[i] = s
+                morrow[i] = s
+            else:
+                goodman[i] = s * uts / (uts - m)
+                gerber[i] = s / (1.0 - m * m * inv_uts2)
+                morrow[i] = s * sf / (sf - m)
+            max_stress = m + s
+            if max_stress <= 0.0:
+                swt[i] = s
+            else:
+                # max() keeps the lane valid if fastmath evaluates the
+                # discarded branch on compressive points.
+                swt[i] = math.sqrt(max(max_stress, 0.0) * s)
+
+    @njit(parallel=True, fastmath=True, cache=True)  # type: ignore
+    def _swt_kernel(
+        amp: NDArray[np.floating],
+        mean: NDArray[np.floating],
+        out: NDArray[np.floating],
+    ) -> None:
+        """Single-pass Smith-Watson-Topper correction kernel."""
+        for i in prange(amp.size):
+            max_stress = mean[i] + amp[i]
+            if max_stress <= 0.0:
+                out[i] = amp[i]
+            else:
+                # max() keeps the lane valid if fastmath evaluates the
+                # discarded branch on compressive points.
+                out[i] = math.sqrt(max(max_stress, 0.0) * amp[i])
+
+    # True NumPy ufuncs compiled per dtype: they participate in the full
+    # ufunc machinery (broadcasting, out=, where=, reductions) without
+    # Python-level temporaries, and the parallel target threads the loop
+    # with SIMD within each chunk. Signatures are declared for float32
+    # and float64 so both precisions dispatch without promotion.
+    _TERNARY_SIGNATURES = [
+        "float32(float32, float32, float32)",
+        "float64(float64, float64, float64)",
+    ]
+    _BINARY_SIGNATURES = [
+        "float32(float32, float32)",
+        "float64(float64, float64)",
+    ]
+
+    @vectorize(_TERNARY_SIGNATURES, target="parallel", fastmath=True)  # type: ignore
+    def goodman_ufunc(
+        stress_amplitude: float,
+        mean_stress: float,
+        ultimate_tensile_strength: float,
+    ) -> float:
+        """Goodman correction as a compiled elementwise ufunc."""
+        if mean_stress <= 0.0:
+            return stress_amplitude
+        return (
+            stress_amplitude
+            * ultimate_tensile_strength
+            / (ultimate_tensile_strength - mean_stress)
+        )
+
+    @vectorize(_TERNARY_SIGNATURES, target="parallel", fastmath=True)  # type: ignore
+    def gerber_ufunc(
+        stress_amplitude: float,
+        mean_stress: float,
+        ultimate_tensile_strength: float,
+    ) -> float:
+        """Gerber correction as a compiled elementwise ufunc."""
+        if mean_stress <= 0.0:
+            return stress_amplitude
+        ratio = mean_stress / ultimate_tensile_strength
+        return stress_amplitude / (1.0 - ratio * ratio)
+
+    @vectorize(_TERNARY_SIGNATURES, target="parallel", fastmath=True)  # type: ignore
+    def morrow_ufunc(
+        stress_amplitude: float,
+        mean_stress: float,
+        fatigue_strength_coefficient: float,
+    ) -> float:
+        """Morrow correction as a compiled elementwise ufunc."""
+        if mean_stress <= 0.0:
+            return stress_amplitude
+        return (
+            stress_amplitude
+            * fatigue_strength_coefficient
+            / (fatigue_strength_coefficient - mean_stress)
+        )
+
+    @vectorize(_BINARY_SIGNATURES, target="parallel", fastmath=True)  # type: ignore
+    def swt_ufunc(stress_amplitude: float, mean_stress: float) -> float:
+        """Smith-Watson-Topper correction as a compiled elementwise ufunc."""
+        max_stress = mean_stress + stress_amplitude
+        if max_stress <= 0.0:
+            return stress_amplitude
+        # Clamp the full sqrt argument: under fastmath the vectorized
+        # ufunc speculates both branches per lane, and clamping only the
+        # maximum stress still lets the discarded lane feed a negative
+        # product into sqrt and raise a spurious RuntimeWarning.
+        return math.sqrt(max(max_stress * stress_amplitude, 0.0))
+
+else:
+    # Plain NumPy stand-ins so the ufunc names are importable without
+    # numba. They broadcast like the real ufuncs but allocate the usual
+    # NumPy temporaries and do not accept out=/where=.
+    def goodman_ufunc(
+        stress_amplitude: NDArray[np.floating] | float,
+        mean_stress: NDArray[np.floating] | float,
+        ultimate_tensile_strength: float,
+    ) -> NDArray[np.floating]:
+        """Goodman correction, elementwise with broadcasting."""
+        stress_amplitude = np.asarray(stress_amplitude)
+        mean_stress = np.asarray(mean_stress)
+        return np.where(
+            mean_stress <= 0,
+            stress_amplitude,
+            stress_amplitude
+            * ultimate_tensile_strength
+            / (ultimate_tensile_strength - mean_stress),
+        )
+
+    def gerber_ufunc(
+        stress_amplitude: NDArray[np.floating] | float,
+        mean_stress: NDArray[np.floating] | float,
+        ultimate_tensile_strength: float,
+    ) -> NDArray[np.floating]:
+        """Gerber correction, elementwise with broadcasting."""
+        stress_amplitude = np.asarray(stress_amplitude)
+        mean_stress = np.asarray(mean_stress)
+        ratio = mean_stress / ultimate_tensile_strength
+        return np.where(
+            mean_stress <= 0,
+            stress_amplitude,
+            stress_amplitude / (1.0 - ratio * ratio),
+        )
+
+    def morrow_ufunc(
+        stress_amplitude: NDArray[np.floating] | float,
+        mean_stress: NDArray[np.floating] | float,
+        fatigue_strength_coefficient: float,
+    ) -> NDArray[np.floating]:
+        """Morrow correction, elementwise with broadcasting."""
+        stress_amplitude = np.asarray(stress_amplitude)
+        mean_stress = np.asarray(mean_stress)
+        return np.where(
+            mean_stress <= 0,
+            stress_amplitude,
+            stress_amplitude
+            * fatigue_strength_coefficient
+            / (fatigue_strength_coefficient - mean_stress),
+        )
+
+    def swt_ufunc(
+        stress_amplitude: NDArray[np.floating] | float,
+        mean_stress: NDArray[np.floating] | float,
+    ) -> NDArray[np.floating]:
+        """Smith-Watson-Topper correction, elementwise with broadcasting."""
+        stress_amplitude = np.asarray(stress_amplitude)
+        mean_stress = np.asarray(mean_stress)
+        max_stress = np.maximum(mean_stress + stress_amplitude, 0.0)
+        return np.where(
+            mean_stress + stress_amplitude <= 0,
+            stress_amplitude,
+            np.sqrt(max_stress * stress_amplitude),
+        )
+
+
+def _validated_inputs(
+    stress_amplitude: ArrayLike,
+    mean_stress: ArrayLike,
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """Coerce correction inputs to matching floating arrays.
+
+    Differing but compatible shapes are broadcast here, once at the API
+    boundary, to one canonical shape; every later operation then works on
+    identically shaped operands instead of re-deriving the broadcast per
+    ufunc call (which multiplies up in the compare-all-methods loops).
+    Floating dtypes are preserved (and promoted to a common one), so
+    float32 cycle sets run the kernels with half the memory traffic and
+    twice the SIMD width; non-floating inputs are promoted to float64.
+
+    Args:
+        stress_amplitude: Stress amplitudes.
+        mean_stress: Mean stresses, broadcastable against the amplitudes.
+
+    Returns:
+        The broadcast amplitude and mean arrays in their common floating
+        dtype.
+
+    Raises:
+        ValueError: If the input shapes are not broadcastable.
+    """
+    # The common case is ndarray in, ndarray out: the isinstance guards
+    # keep repeated calls from paying the asarray re-wrap, and the dtype
+    # casts below are no-ops returning the input array unchanged.
+    if not isinstance(stress_amplitude, np.ndarray):
+        stress_amplitude = np.asarray(stress_amplitude)
+    if not isinstance(mean_stress, np.ndarray):
+        mean_stress = np.asarray(mean_stress)
+    if stress_amplitude.shape != mean_stress.shape:
+        try:
+            stress_amplitude, mean_stress = np.broadcast_arrays(
+                stress_amplitude, mean_stress
+            )
+        except ValueError:
+            raise ValueError(
+                "Stress amplitude and mean stress must have broadcastable shapes."
+            ) from None
+    if not np.issubdtype(stress_amplitude.dtype, np.floating):
+        stress_amplitude = stress_amplitude.astype(np.float64)
+    if not np.issubdtype(mean_stress.dtype, np.floating):
+        mean_stress = mean_stress.astype(np.float64)
+    dtype = np.result_type(stress_amplitude, mean_stress)
+    stress_amplitude = stress_amplitude.astype(dtype, copy=False)
+    mean_stress = mean_stress.astype(dtype, copy=False)
+    return stress_amplitude, mean_stress
+
+
+def _flat_contiguous(array: NDArray[np.floating]) -> NDArray[np.floating]:
+    """Return the array as a flat contiguous view, copying only if needed.
+
+    The kernels need contiguous 1-D data for aligned SIMD loads; inputs
+    that already are C-contiguous (the common case) pass through as a
+    zero-copy reshape, the copy is paid only for strided views.
+    """
+    if not array.flags.c_contiguous:
+        array = np.ascontiguousarray(array)
+    return array.reshape(-1)
+
+
+_UNIFORM_SCAN_LIMIT = 1 << 16
+"""Largest mean stress array scanned for the all-compressive early out.
+
+The scan is a single O(n) reduction that, when it hits, replaces the
+whole correction with a pass-through; above this size the reduction
+itself costs a noticeable fraction of the correction and is skipped.
+"""
+
+
+def _as_floating_array(values: ArrayLike) -> NDArray[np.floating]:
+    """Return the values as a floating ndarray, promoting only if needed."""
+    if not isinstance(values, np.ndarray):
+        values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(np.float64)
+    return values
+
+
+def _uniformly_nonpositive(mean_stress: NDArray[np.floating]) -> bool:
+    """Check cheaply whether no point carries a tensile mean stress.
+
+    Bounded by ``_UNIFORM_SCAN_LIMIT`` so the check never dominates.
+    """
+    return mean_stress.size <= _UNIFORM_SCAN_LIMIT and not bool(np.any(mean_stress > 0))
+
+
+def _numexpr_where(
+    expression: str,
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating],
+    constant: float | None = None,
+) -> NDArray[np.floating]:
+    """Evaluate a correction expression with the numexpr virtual machine.
+
+    numexpr runs the whole where-expression over L1-sized tiles with its
+    own thread pool, fusing the operations without the full-size
+    temporaries the plain NumPy path allocates. The material constant is
+    bound as a scalar of the input dtype so float32 data is not silently
+    promoted by numexpr's safe casting.
+
+    Args:
+        expression: numexpr expression over ``sa``, ``sm`` and ``c``.
+        stress_amplitude: Validated stress amplitudes.
+        mean_stress: Validated mean stresses.
+        constant: Optional material constant bound as ``c``.
+
+    Returns:
+        The evaluated expression, same shape as the inputs.
+    """
+    local_dict: dict[str, NDArray[np.floating] | np.floating] = {
+        "sa": stress_amplitude,
+        "sm": mean_stress,
+    }
+    if constant is not None:
+        local_dict["c"] = stress_amplitude.dtype.type(constant)
+    result: NDArray[np.floating] = numexpr.evaluate(expression, local_dict=local_dict)
+    return result
+
+
+def _run_kernel(
+    kernel: Callable[..., None],
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating],
+    *scalar_args: float,
+) -> NDArray[np.floating]:
+    """Run a jitted correction kernel over flattened contiguous views.
+
+    Shared dispatch for all correction entry points: allocates the output,
+    flattens the (already validated) inputs to contiguous 1-D views and
+    invokes the kernel with any trailing scalar arguments.
+    """
+    out = np.empty_like(stress_amplitude)
+    kernel(
+        _flat_contiguous(stress_amplitude),
+        _flat_contiguous(mean_stress),
+        *scalar_args,
+        out.reshape(-1),
+    )
+    return out
+
+
+def calc_goodman_eq_stress(
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating] | float,
+    ultimate_tensile_strength: float,
+) -> NDArray[np.floating]:
+    r"""Calculate the Goodman mean stress corrected equivalent amplitude.
+
+    Points with non-positive mean stress pass through uncorrected; tensile
+    points are scaled by :math:`1 / (1 - \sigma_m / R_m)`, evaluated in
+    the equivalent form :math:`\sigma_a R_m / (R_m - \sigma_m)` that
+    keeps a single division in the inner loop. With numba installed, a
+    jitted kernel branches per element in one pass; the NumPy path
+    computes the division in place only where the mean stress is tensile
+    via a masked divide, so no work is done (and no divide by a vanishing
+    denominator risked) on pass-through points.
+
+    Args:
+        stress_amplitude: Stress amplitudes, any shape.
+        mean_stress: Mean stresses, same shape as the amplitudes, or a
+            scalar for a single load level (handled by a branch-free
+            scaled copy instead of a per-element pass).
+        ultimate_tensile_strength: Ultimate tensile strength of the material.
+
+    Returns:
+        Corrected equivalent stress amplitudes, same shape as the input.
+        When no point needs correcting, the amplitudes are returned
+        as-is (no copy).
+
+    Raises:
+        ValueError: If the input shapes differ or the strength is not
+            positive.
+    """
+    if ultimate_tensile_strength <= 0:
+        raise ValueError("Ultimate tensile strength must be positive.")
+    if np.ndim(mean_stress) == 0:
+        # Single load level: one Python branch and, for tensile means, a
+        # single scalar division amortized over the whole array.
+        stress_amplitude = _as_floating_array(stress_amplitude)
+        mean = float(mean_stress)
+        if mean <= 0.0:
+            return stress_amplitude
+        scale = ultimate_tensile_strength / (ultimate_tensile_strength - mean)
+        return stress_amplitude * scale
+    stress_amplitude, mean_stress = _validated_inputs(stress_amplitude, mean_stress)
+    if _uniformly_nonpositive(mean_stress):
+        return stress_amplitude
+
+    if NUMBA_AVAILABLE:
+        return _run_kernel(
+            _goodman_kernel, stress_amplitude, mean_stress, ultimate_tensile_strength
+        )
+    if NUMEXPR_AVAILABLE:
+        return _numexpr_where(
+            "where(sm <= 0, sa, sa * c / (c - sm))",
+            stress_amplitude,
+            mean_stress,
+            ultimate_tensile_strength,
+        )
+    out = np.array(stress_amplitude, copy=True)
+    np.divide(
+        stress_amplitude * ultimate_tensile_strength,
+        ultimate_tensile_strength - mean_stress,
+        out=out,
+        where=mean_stress > 0,
+    )
+    return out
+
+
+def calc_gerber_eq_stress(
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating] | float,
+    ultimate_tensile_strength: float,
+) -> NDArray[np.floating]:
+    r"""Calculate the Gerber mean stress corrected equivalent amplitude.
+
+    Points with non-positive mean stress pass through uncorrected; tensile
+    points are scaled by :math:`1 / (1 - (\sigma_m / R_m)^2)`. With numba
+    installed, a jitted kernel branches per element in one pass instead of
+    eagerly evaluating the correction for the whole array.
+
+    Args:
+        stress_amplitude: Stress amplitudes, any shape.
+        mean_stress: Mean stresses, same shape as the amplitudes, or a
+            scalar for a single load level (handled by a branch-free
+            scaled copy instead of a per-element pass).
+        ultimate_tensile_strength: Ultimate tensile strength of the material.
+
+    Returns:
+        Corrected equivalent stress amplitudes, same shape as the input.
+        When no point needs correcting, the amplitudes are returned
+        as-is (no copy).
+
+    Raises:
+        ValueError: If the input shapes differ or the strength is not
+            positive.
+    """
+    if ultimate_tensile_strength <= 0:
+        raise ValueError("Ultimate tensile strength must be positive.")
+    if np.ndim(mean_stress) == 0:
+        stress_amplitude = _as_floating_array(stress_amplitude)
+        mean = float(mean_stress)
+        if mean <= 0.0:
+            return stress_amplitude
+        ratio = mean / ultimate_tensile_strength
+        return stress_amplitude * (1.0 / (1.0 - ratio * ratio))
+    stress_amplitude, mean_stress = _validated_inputs(stress_amplitude, mean_stress)
+    if _uniformly_nonpositive(mean_stress):
+        return stress_amplitude
+
+    if NUMBA_AVAILABLE:
+        return _run_kernel(
+            _gerber_kernel, stress_amplitude, mean_stress, ultimate_tensile_strength
+        )
+    if NUMEXPR_AVAILABLE:
+        return _numexpr_where(
+            "where(sm <= 0, sa, sa / (1 - (sm / c) * (sm / c)))",
+            stress_amplitude,
+            mean_stress,
+            ultimate_tensile_strength,
+        )
+    inv_uts = 1.0 / ultimate_tensile_strength
+    inv_uts2 = inv_uts * inv_uts
+    return np.where(
+        mean_stress <= 0,
+        stress_amplitude,
+        stress_amplitude / (1.0 - mean_stress * mean_stress * inv_uts2),
+    )
+
+
+def calc_morrow_eq_stress(
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating] | float,
+    fatigue_strength_coefficient: float,
+) -> NDArray[np.floating]:
+    r"""Calculate the Morrow mean stress corrected equivalent amplitude.
+
+    Points with non-positive mean stress pass through uncorrected; tensile
+    points are scaled by :math:`1 / (1 - \sigma_m / \sigma_f')`. With
+    numba installed, a jitted kernel branches per element in one pass; the
+    NumPy path uses the same masked in-place divide as Goodman.
+
+    Args:
+        stress_amplitude: Stress amplitudes, any shape.
+        mean_stress: Mean stresses, same shape as the amplitudes, or a
+            scalar for a single load level.
+        fatigue_strength_coefficient: Fatigue strength coefficient of the
+            material.
+
+    Returns:
+        Corrected equivalent stress amplitudes, same shape as the input.
+        When no point needs correcting, the amplitudes are returned
+        as-is (no copy).
+
+    Raises:
+        ValueError: If the input shapes differ or the coefficient is not
+            positive.
+    """
+    if fatigue_strength_coefficient <= 0:
+        raise ValueError("Fatigue strength coefficient must be positive.")
+    if np.ndim(mean_stress) == 0:
+        stress_amplitude = _as_floating_array(stress_amplitude)
+        mean = float(mean_stress)
+        if mean <= 0.0:
+            return stress_amplitude
+        scale = fatigue_strength_coefficient / (fatigue_strength_coefficient - mean)
+        return stress_amplitude * scale
+    stress_amplitude, mean_stress = _validated_inputs(stress_amplitude, mean_stress)
+    if _uniformly_nonpositive(mean_stress):
+        return stress_amplitude
+
+    if NUMBA_AVAILABLE:
+        return _run_kernel(
+            _morrow_kernel, stress_amplitude, mean_stress, fatigue_strength_coefficient
+        )
+    if NUMEXPR_AVAILABLE:
+        return _numexpr_where(
+            "where(sm <= 0, sa, sa * c / (c - sm))",
+            stress_amplitude,
+            mean_stress,
+            fatigue_strength_coefficient,
+        )
+    out = np.array(stress_amplitude, copy=True)
+    np.divide(
+        stress_amplitude * fatigue_strength_coefficient,
+        fatigue_strength_coefficient - mean_stress,
+        out=out,
+        where=mean_stress > 0,
+    )
+    return out
+
+
+def calc_swt_eq_stress(
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating],
+) -> NDArray[np.floating]:
+    r"""Calculate the Smith-Watson-Topper corrected equivalent amplitude.
+
+    The corrected amplitude is :math:`\sqrt{\sigma_{max} \sigma_a}` with
+    :math:`\sigma_{max} = \sigma_m + \sigma_a`; points with non-positive
+    maximum stress pass through uncorrected. With numba installed, a jitted
+    kernel branches per element in one pass instead of eagerly evaluating
+    the correction for the whole array.
+
+    Args:
+        stress_amplitude: Stress amplitudes, any shape.
+        mean_stress: Mean stresses, same shape as the amplitudes.
+
+    Returns:
+        Corrected equivalent stress amplitudes, same shape as the input.
+
+    Raises:
+        ValueError: If the input shapes differ.
+    """
+    stress_amplitude, mean_stress = _validated_inputs(stress_amplitude, mean_stress)
+
+    if NUMBA_AVAILABLE:
+        return _run_kernel(_swt_kernel, stress_amplitude, mean_stress)
+    if NUMEXPR_AVAILABLE:
+        # The discarded branch clips its sqrt argument at zero so the
+        # compressive lanes never evaluate a negative square root.
+        return _numexpr_where(
+            "where(sm + sa <= 0, sa, sqrt(where(sm + sa > 0, sm + sa, 0) * sa))",
+            stress_amplitude,
+            mean_stress,
+        )
+    # One buffer carries the whole chain: max stress, clipped product,
+    # sqrt, then the compressive points are patched from the input. The
+    # clipping keeps the sqrt argument non-negative for points whose
+    # result is overwritten anyway, so no NaN warning is triggered.
+    out: NDArray[np.floating] = np.add(mean_stress, stress_amplitude)
+    compressive = out <= 0
+    np.maximum(out, 0.0, out=out)
+    np.multiply(out, stress_amplitude, out=out)
+    np.sqrt(out, out=out)
+    np.copyto(out, stress_amplitude, where=compressive)
+    return out
+
+
+def make_goodman_correction(ultimate_tensile_strength: float) -> CorrectionFunc:
+    """Specialize the Goodman correction for a fixed material strength.
+
+    The strength is a single constant across a whole fatigue sweep, so it
+    is baked into a closure once: with numba installed the closure is
+    jitted with the constant folded into the compiled kernel,
+    and every subsequent call skips both the division setup and the scalar
+    argument passing of the generic entry point.
+
+    Args:
+        ultimate_tensile_strength: Ultimate tensile strength of the
+            material.
+
+    Returns:
+        A callable ``correction(stress_amplitude, mean_stress)`` applying
+        the Goodman correction for this material.
+
+    Raises:
+        ValueError: If the strength is not positive.
+    """
+    if ultimate_tensile_strength <= 0:
+        raise ValueError("Ultimate tensile strength must be positive.")
+    uts = ultimate_tensile_strength
+
+    if NUMBA_AVAILABLE:
+
+        @njit(parallel=True, fastmath=True)  # type: ignore
+        def _kernel(
+            amp: NDArray[np.floating],
+            mean: NDArray[np.floating],
+            out: NDArray[np.floating],
+        ) -> None:
+            for i in prange(amp.size):
+                m = mean[i]
+                if m <= 0.0:
+                    out[i] = amp[i]
+                else:
+                    out[i] = amp[i] * uts / (uts - m)
+
+        def correction(
+            stress_amplitude: NDArray[np.floating],
+            mean_stress: NDArray[np.floating],
+        ) -> NDArray[np.floating]:
+            """Apply the specialized Goodman correction."""
+            stress_amplitude, mean_stress = _validated_inputs(
+                stress_amplitude, mean_stress
+            )
+            return _run_kernel(_kernel, stress_amplitude, mean_stress)
+
+        return correction
+
+    def correction_numpy(
+        stress_amplitude: NDArray[np.floating],
+        mean_stress: NDArray[np.floating],
+    ) -> NDArray[np.floating]:
+        """Apply the specialized Goodman correction (NumPy fallback)."""
+        stress_amplitude, mean_stress = _validated_inputs(stress_amplitude, mean_stress)
+        return np.where(
+            mean_stress <= 0,
+            stress_amplitude,
+            stress_amplitude * uts / (uts - mean_stress),
+        )
+
+    return correction_numpy
+
+
+def make_gerber_correction(ultimate_tensile_strength: float) -> CorrectionFunc:
+    """Specialize the Gerber correction for a fixed material strength.
+
+    See ``make_goodman_correction``; the squared reciprocal of the
+    strength is folded into the returned callable the same way.
+
+    Args:
+        ultimate_tensile_strength: Ultimate tensile strength of the
+            material.
+
+    Returns:
+        A callable ``correction(stress_amplitude, mean_stress)`` applying
+        the Gerber correction for this material.
+
+    Raises:
+        ValueError: If the strength is not positive.
+    """
+    if ultimate_tensile_strength <= 0:
+        raise ValueError("Ultimate tensile strength must be positive.")
+    inv_uts = 1.0 / ultimate_tensile_strength
+    inv_uts2 = inv_uts * inv_uts
+
+    if NUMBA_AVAILABLE:
+
+        @njit(parallel=True, fastmath=True)  # type: ignore
+        def _kernel(
+            amp: NDArray[np.floating],
+            mean: NDArray[np.floating],
+            out: NDArray[np.floating],
+        ) -> None:
+            for i in prange(amp.size):
+                m = mean[i]
+                if m <= 0.0:
+                    out[i] = amp[i]
+                else:
+                    out[i] = amp[i] / (1.0 - m * m * inv_uts2)
+
+        def correction(
+            stress_amplitude: NDArray[np.floating],
+            mean_stress: NDArray[np.floating],
+        ) -> NDArray[np.floating]:
+            """Apply the specialized Gerber correction."""
+            stress_amplitude, mean_stress = _validated_inputs(
+                stress_amplitude, mean_stress
+            )
+            return _run_kernel(_kernel, stress_amplitude, mean_stress)
+
+        return correction
+
+    def correction_numpy(
+        stress_amplitude: NDArray[np.floating],
+        mean_stress: NDArray[np.floating],
+    ) -> NDArray[np.floating]:
+        """Apply the specialized Gerber correction (NumPy fallback)."""
+        stress_amplitude, mean_stress = _validated_inputs(stress_amplitude, mean_stress)
+        return np.where(
+            mean_stress <= 0,
+            stress_amplitude,
+            stress_amplitude / (1.0 - mean_stress * mean_stress * inv_uts2),
+        )
+
+    return correction_numpy
+
+
+def make_correction(
+    kind: str,
+    ultimate_tensile_strength: float | None = None,
+    fatigue_strength_coefficient: float | None = None,
+) -> CorrectionFunc:
+    """Return a correction callable by name, specialized where possible.
+
+    Single factory entry point over the correction family: Goodman and
+    Gerber come back as material-specialized closures (see
+    ``make_goodman_correction``), Morrow binds its coefficient the same
+    way, and Smith-Watson-Topper needs no material constant and returns
+    the generic function. Drivers resolve the callable once and reuse it
+    inside cycle loops instead of paying the name dispatch per call.
+
+    Args:
+        kind: Correction name, one of ``"goodman"``, ``"gerber"``,
+            ``"swt"``, ``"morrow"``.
+        ultimate_tensile_strength: Ultimate tensile strength; required for
+            Goodman and Gerber, ignored otherwise.
+        fatigue_strength_coefficient: Fatigue strength coefficient;
+            required for Morrow, ignored otherwise.
+
+    Returns:
+        A callable ``correction(stress_amplitude, mean_stress)``.
+
+    Raises:
+        ValueError: If the kind is unknown or a required material
+            constant is missing or not positive.
+    """
+    if kind == "swt":
+        return calc_swt_eq_stress
+    if kind == "morrow":
+        if fatigue_strength_coefficient is None:
+            raise ValueError(
+                "The morrow correction requires a fatigue strength coefficient."
+            )
+        if fatigue_strength_coefficient <= 0:
+            raise ValueError("Fatigue strength coefficient must be positive.")
+        coefficient = fatigue_strength_coefficient
+
+        def morrow_correction(
+            stress_amplitude: NDArray[np.floating],
+            mean_stress: NDArray[np.floating],
+        ) -> NDArray[np.floating]:
+            """Apply the Morrow correction for the bound coefficient."""
+            return calc_morrow_eq_stress(stress_amplitude, mean_stress, coefficient)
+
+        return morrow_correction
+    factories = {
+        "goodman": make_goodman_correction,
+        "gerber": make_gerber_correction,
+    }
+    if kind not in factories:
+        raise ValueError(f"Unknown correction kind: {kind!r}")
+    if ultimate_tensile_strength is None:
+        raise ValueError(f"The {kind} correction requires a tensile strength.")
+    return factories[kind](ultimate_tensile_strength)
+
+
+def goodman(
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating],
+    material: MaterialProperties,
+) -> NDArray[np.floating]:
+    """Apply the Goodman correction using the material constants.
+
+    Registry form of ``calc_goodman_eq_stress``: the material object
+    carries the tensile strength.
+    """
+    return calc_goodman_eq_stress(
+        stress_amplitude, mean_stress, material.ultimate_tensile_strength
+    )
+
+
+def gerber(
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating],
+    material: MaterialProperties,
+) -> NDArray[np.floating]:
+    """Apply the Gerber correction using the material constants.
+
+    Registry form of ``calc_gerber_eq_stress``.
+    """
+    return calc_gerber_eq_stress(
+        stress_amplitude, mean_stress, material.ultimate_tensile_strength
+    )
+
+
+def swt(
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating],
+    material: MaterialProperties,
+) -> NDArray[np.floating]:
+    """Apply the Smith-Watson-Topper correction.
+
+    Registry form of ``calc_swt_eq_stress``; the material is unused but
+    kept so every registry entry shares one signature.
+    """
+    return calc_swt_eq_stress(stress_amplitude, mean_stress)
+
+
+def morrow(
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating],
+    material: MaterialProperties,
+) -> NDArray[np.floating]:
+    """Apply the Morrow correction using the material constants.
+
+    Registry form of ``calc_morrow_eq_stress``.
+
+    Raises:
+        ValueError: If the material has no fatigue strength coefficient.
+    """
+    fatigue_strength_coefficient = material.fatigue_strength_coefficient
+    if fatigue_strength_coefficient is None:
+        raise ValueError(
+            "The Morrow correction requires a fatigue strength coefficient."
+        )
+    return calc_morrow_eq_stress(
+        stress_amplitude, mean_stress, fatigue_strength_coefficient
+    )
+
+
+CORRECTIONS: dict[str, MaterialCorrectionFunc] = {
+    "goodman": goodman,
+    "gerber": gerber,
+    "swt": swt,
+    "morrow": morrow,
+}
+"""Registry of the mean stress corrections, keyed by name.
+
+Drivers that pick corrections dynamically (per element, per weld class)
+resolve the callable from this dict once and call it directly; a plain
+function reference skips the descriptor lookup and abstract-method
+dispatch of the class interface on every call.
+"""
+
+
+class MeanStressCorrection(ABC):
+    """Strategy interface for mean stress corrections.
+
+    Implementations are fully vectorized: the amplitude and mean stress
+    arrays are processed in one NumPy (or jitted) pass, so whole rainflow
+    cycle sets run through a single C loop instead of per-element Python
+    calls. The classes are thin wrappers kept for callers written against
+    the interface; new code should prefer the ``CORRECTIONS`` registry
+    functions, which avoid the per-call method dispatch.
+    """
+
+    @abstractmethod
+    def eq_stress_amplitude(
+        self,
+        stress_amplitude: NDArray[np.floating],
+        mean_stress: NDArray[np.floating],
+        material: MaterialProperties,
+    ) -> NDArray[np.floating]:
+        """Calculate the mean stress corrected equivalent amplitude.
+
+        Args:
+            stress_amplitude: Stress amplitudes, any shape.
+            mean_stress: Mean stresses, same shape as the amplitudes.
+            material: Material the correction constants are taken from.
+
+        Returns:
+            Corrected equivalent stress amplitudes, same shape as the
+            input.
+        """
+
+
+class GoodmanCorrection(MeanStressCorrection):
+    """Goodman (linear) mean stress correction."""
+
+    def eq_stress_amplitude(
+        self,
+        stress_amplitude: NDArray[np.floating],
+        mean_stress: NDArray[np.floating],
+        material: MaterialProperties,
+    ) -> NDArray[np.floating]:
+        """Calculate the Goodman corrected equivalent amplitude.
+
+        See ``calc_goodman_eq_stress``, which this delegates to.
+        """
+        return goodman(stress_amplitude, mean_stress, material)
+
+
+class GerberCorrection(MeanStressCorrection):
+    """Gerber (parabolic) mean stress correction."""
+
+    def eq_stress_amplitude(
+        self,
+        stress_amplitude: NDArray[np.floating],
+        mean_stress: NDArray[np.floating],
+        material: MaterialProperties,
+    ) -> NDArray[np.floating]:
+        """Calculate the Gerber corrected equivalent amplitude.
+
+        See ``calc_gerber_eq_stress``, which this delegates to.
+        """
+        return gerber(stress_amplitude, mean_stress, material)
+
+
+class SWTCorrection(MeanStressCorrection):
+    """Smith-Watson-Topper mean stress correction."""
+
+    def eq_stress_amplitude(
+        self,
+        stress_amplitude: NDArray[np.floating],
+        mean_stress: NDArray[np.floating],
+        material: MaterialProperties,
+    ) -> NDArray[np.floating]:
+        """Calculate the SWT corrected equivalent amplitude.
+
+        See ``calc_swt_eq_stress``, which this delegates to; the material
+        is unused but kept for interface uniformity.
+        """
+        return swt(stress_amplitude, mean_stress, material)
+
+
+class MorrowCorrection(MeanStressCorrection):
+    """Morrow mean stress correction."""
+
+    def eq_stress_amplitude(
+        self,
+        stress_amplitude: NDArray[np.floating],
+        mean_stress: NDArray[np.floating],
+        material: MaterialProperties,
+    ) -> NDArray[np.floating]:
+        """Calculate the Morrow corrected equivalent amplitude.
+
+        See ``calc_morrow_eq_stress``, which this delegates to.
+
+        Raises:
+            ValueError: If the material has no fatigue strength
+                coefficient.
+        """
+        return morrow(stress_amplitude, mean_stress, material)
+
+
+def compute_all_corrections(
+    stress_amplitude: NDArray[np.floating],
+    mean_stress: NDArray[np.floating],
+    material: MaterialProperties,
+) -> dict[str, NDArray[np.floating]]:
+    """Calculate all four mean stress corrections in one pass.
+
+    Comparing Goodman/Gerber/SWT/Morrow on the same cycle set is a common
+    workflow; running them separately reads the amplitude and mean arrays
+    from memory four times. With numba installed a fused kernel reads each
+    element once and writes all four outputs per iteration; without numba
+    the corrections run individually.
+
+    Args:
+        stress_amplitude: Stress amplitudes, any shape.
+        mean_stress: Mean stresses, same shape as the amplitudes.
+        material: Material providing the tensile strength and the fatigue
+            strength coefficient.
+
+    Returns:
+        Mapping of correction name (``goodman``, ``gerber``, ``swt``,
+        ``morrow``) to the corrected amplitudes.
+
+    Raises:
+        ValueError: If the input shapes differ or the material has no
+            fatigue strength coefficient.
+    """
+    ultimate_tensile_strength = material.ultimate_tensile_strength
+    fatigue_strength_coefficient = material.fatigue_strength_coefficient
+    if fatigue_strength_coefficient is None:
+        raise ValueError(
+            "Computing all corrections requires a fatigue strength coefficient."
+        )
+    stress_amplitude, mean_stress = _validated_inputs(stress_amplitude, mean_stress)
+
+    if NUMBA_AVAILABLE:
+        outputs = {
+            name: np.empty_like(stress_amplitude)
+            for name in ("goodman", "gerber", "swt", "morrow")
+        }
+        _all_corrections_kernel(
+            _flat_contiguous(stress_amplitude),
+            _flat_contiguous(mean_stress),
+            ultimate_tensile_strength,
+            fatigue_strength_coefficient,
+            outputs["goodman"].reshape(-1),
+            outputs["gerber"].reshape(-1),
+            outputs["swt"].reshape(-1),
+            outputs["morrow"].reshape(-1),
+        )
+        return outputs
+
+    return {
+        "goodman": calc_goodman_eq_stress(
+            stress_amplitude, mean_stress, ultimate_tensile_strength
+        ),
+        "gerber": calc_gerber_eq_stress(
+            stress_amplitude, mean_stress, ultimate_tensile_strength
+        ),
+        "swt": calc_swt_eq_stress(stress_amplitude, mean_stress),
+        "morrow": calc_morrow_eq_stress(
+            stress_amplitude, mean_stress, fatigue_strength_coefficient
+        ),
+    }
@@ -1 +1,242 @@
 """Finite element model parsing module."""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from fatpy.structural_mechanics.eq_stresses import cycle_extremes
+
+STRESS_COMPONENTS = ("xx", "yy", "zz", "xy", "yz", "zx")
+
+
+@dataclass
+class FEModel:
+    """Container for finite element results used by the fatigue criteria.
+
+    Stresses are stored component-wise (structure-of-arrays): the block of
+    shape (6, n) holds one C-contiguous row per component in the order
+    (xx, yy, zz, xy, yz, zx). Each von Mises term in the equivalent-stress
+    kernels then streams a single contiguous array, which keeps hardware
+    prefetch and the vectorized NumPy ufunc loops effective. The classic
+    (n, 6) array-of-structures layout would hand those kernels strided
+    column views instead.
+
+    The FE input block stays read-only once ingested; derived equivalent
+    stresses are kept separately in ``eq_stress_results``, keyed by result
+    name. Storing each result column under its name avoids the repeated
+    reallocation and full-tensor copy that appending columns to the input
+    block would cost.
+
+    Args:
+        stress_components: Stress components, shape (6, n), one row per
+            component in the order (xx, yy, zz, xy, yz, zx).
+        eq_stress_results: Named equivalent-stress results, each of
+            shape (n,). Usually populated via ``add_eq_stress``.
+        connectivity: Optional element connectivity, mapping element id to
+            the ids of its nodes. Stored internally as a CSR-style
+            node-to-elements map built with vectorized NumPy operations.
+        min_stress_tensor: Cached per-point minimum cycle tensors,
+            shape (n, 6). Populated once via ``prepare_cycle`` and reused
+            by every criterion applied to the model.
+        max_stress_tensor: Cached per-point maximum cycle tensors,
+            shape (n, 6).
+    """
+
+    stress_components: NDArray[np.floating]
+    eq_stress_results: dict[str, NDArray[np.floating]] = field(default_factory=dict)
+    connectivity: Mapping[int, Sequence[int]] | None = None
+    min_stress_tensor: NDArray[np.floating] | None = None
+    max_stress_tensor: NDArray[np.floating] | None = None
+    _node_ids: NDArray[np.int64] = field(init=False, repr=False)
+    _node_elem_indptr: NDArray[np.int64] = field(init=False, repr=False)
+    _node_elems: NDArray[np.int64] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validate the component block and build derived lookup structures."""
+        if self.stress_components.ndim != 2 or self.stress_components.shape[0] != 6:
+            raise ValueError("Stress components must have the shape (6, n).")
+        dtype = self.stress_components.dtype
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.dtype(np.float64)
+        self.stress_components = np.ascontiguousarray(
+            self.stress_components, dtype=dtype
+        )
+        self._build_node_element_map()
+
+    def _build_node_element_map(self) -> None:
+        """Build the CSR-style node-to-elements map from the connectivity.
+
+        The (element, node) pairs are flattened into two integer arrays,
+        stably sorted by node id and split into per-node segments via
+        ``np.unique``. The whole construction runs in vectorized NumPy
+        instead of a Python dict-of-lists loop, which matters for
+        million-element meshes both in time and in memory.
+        """
+        if not self.connectivity:
+            self._node_ids = np.empty(0, dtype=np.int64)
+            self._node_elem_indptr = np.zeros(1, dtype=np.int64)
+            self._node_elems = np.empty(0, dtype=np.int64)
+            return
+
+        n_elements = len(self.connectivity)
+        elem_ids = np.fromiter(
+            self.connectivity.keys(), dtype=np.int64, count=n_elements
+        )
+        counts = np.fromiter(
+            (len(nodes) for nodes in self.connectivity.values()),
+            dtype=np.int64,
+            count=n_elements,
+        )
+        node_ids = np.concatenate(
+            [np.asarray(nodes, dtype=np.int64) for nodes in self.connectivity.values()]
+        )
+
+        order = np.argsort(node_ids, kind="stable")
+        nodes_sorted = node_ids[order]
+        elems_sorted = np.repeat(elem_ids, counts)[order]
+
+        unique_nodes, starts = np.unique(nodes_sorted, return_index=True)
+        self._node_ids = unique_nodes
+        self._node_elem_indptr = np.append(starts, nodes_sorted.size).astype(np.int64)
+        self._node_elems = elems_sorted
+
+    def elements_for_node(self, node_id: int) -> NDArray[np.int64]:
+        """Return the ids of all elements attached to a node.
+
+        The lookup is an O(log n) binary search into the CSR map followed
+        by a zero-copy slice.
+
+        Args:
+            node_id: Id of the node to look up.
+
+        Returns:
+            Ids of the elements containing the node.
+
+        Raises:
+            KeyError: If the node id does not appear in the connectivity.
+        """
+        idx = int(np.searchsorted(self._node_ids, node_id))
+        if idx == self._node_ids.size or self._node_ids[idx] != node_id:
+            raise KeyError(f"Unknown node id: {node_id}")
+        start = self._node_elem_indptr[idx]
+        stop = self._node_elem_indptr[idx + 1]
+        return self._node_elems[start:stop]
+
+    @classmethod
+    def from_stress_tensor(cls, stress_tensor: NDArray[np.floating]) -> "FEModel":
+        """Build a model from stress tensors in the common (n, 6) layout.
+
+        The tensor is transposed to the internal (6, n) layout and copied
+        into contiguous per-component rows.
+
+        Args:
+            stress_tensor: Stress tensors in Voigt notation, shape (n, 6),
+                components ordered (xx, yy, zz, xy, yz, zx).
+
+        Returns:
+            A new model holding the component-wise stress data.
+
+        Raises:
+            ValueError: If the tensor does not have the shape (n, 6).
+        """
+        stress_tensor = np.asarray(stress_tensor)
+        if not np.issubdtype(stress_tensor.dtype, np.floating):
+            stress_tensor = stress_tensor.astype(np.float64)
+        if stress_tensor.ndim != 2 or stress_tensor.shape[1] != 6:
+            raise ValueError("Stress tensor must have the shape (n, 6).")
+        return cls(stress_components=np.ascontiguousarray(stress_tensor.T))
+
+    def astype(self, dtype: np.dtype[np.floating] | type[np.floating]) -> "FEModel":
+        """Return a copy of the model with stresses cast to another dtype.
+
+        Casting a large model to float32 halves its memory footprint and
+        the bytes moved by the memory-bound criterion kernels, at a
+        precision (~7 digits) still far beyond typical material data.
+
+        Args:
+            dtype: Target floating dtype, e.g. ``np.float32``.
+
+        Returns:
+            A new model with cast stress components; the connectivity is
+            shared, derived results are not carried over.
+        """
+        return FEModel(
+            stress_components=self.stress_components.astype(dtype),
+            connectivity=self.connectivity,
+        )
+
+    def prepare_cycle(self, stress_history: NDArray[np.floating]) -> None:
+        """Compute and cache the per-point cycle extreme tensors.
+
+        A typical sweep applies several criteria and corrections to the
+        same FE data; deriving the extremes once here instead of inside
+        every criterion call turns k passes over the (t, n, 6) history
+        into one.
+
+        Args:
+            stress_history: Stress tensors per load step, shape (t, n, 6),
+                components ordered (xx, yy, zz, xy, yz, zx).
+
+        Raises:
+            ValueError: If the history shape does not match the model.
+        """
+        if stress_history.ndim != 3 or stress_history.shape[1] != self.n_points:
+            raise ValueError(
+                f"Stress history must have the shape (t, {self.n_points}, 6)."
+            )
+        self.min_stress_tensor, self.max_stress_tensor = cycle_extremes(stress_history)
+
+    @property
+    def n_points(self) -> int:
+        """Number of evaluation points in the model."""
+        return int(self.stress_components.shape[1])
+
+    def component(self, name: str) -> NDArray[np.floating]:
+        """Return the contiguous 1-D stress array of a named component.
+
+        Args:
+            name: Component name, one of (xx, yy, zz, xy, yz, zx).
+
+        Returns:
+            The stress values of the component, shape (n,).
+
+        Raises:
+            KeyError: If the component name is unknown.
+        """
+        if name not in STRESS_COMPONENTS:
+            raise KeyError(f"Unknown stress component: {name!r}")
+        return cast(
+            NDArray[np.floating],
+            self.stress_components[STRESS_COMPONENTS.index(name)],
+        )
+
+    def add_eq_stress(self, name: str, values: NDArray[np.floating]) -> None:
+        """Store an equivalent-stress result under a name.
+
+        The array is stored by reference — no copy is made and the FE input
+        block is left untouched, so repeated calls stay O(n) instead of the
+        O(n * k) reallocation of stacking result columns onto the input.
+
+        Args:
+            name: Result name, e.g. ``"manson_mcknight_amplitude"``.
+            values: Equivalent stresses, shape (n,).
+
+        Raises:
+            ValueError: If the result length does not match the model size.
+        """
+        if values.shape != (self.n_points,):
+            raise ValueError(
+                f"Equivalent stress result must have the shape ({self.n_points},)."
+            )
+        self.eq_stress_results[name] = values
+
+    def stress_tensor(self) -> NDArray[np.floating]:
+        """Return the stresses as (n, 6) tensors in Voigt notation.
+
+        The result is a transposed view of the internal component block;
+        no data is copied.
+        """
+        return self.stress_components.T
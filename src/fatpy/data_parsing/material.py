@@ -1 +1,74 @@
 """Material properties parsing module."""
+
+from dataclasses import dataclass
+from typing import cast
+
+_POSITIVE_FIELDS = (
+    ("ultimate_tensile_strength", "Ultimate tensile strength"),
+    ("yield_strength", "Yield strength"),
+    ("elastic_modulus", "Elastic modulus"),
+    ("poisson_ratio", "Poisson's ratio"),
+)
+
+
+@dataclass(slots=True, frozen=True)
+class MaterialProperties:
+    """Mechanical and fatigue properties of a material.
+
+    The dataclass is frozen with slots: instances are immutable value
+    objects without a per-instance ``__dict__``, which makes the attribute
+    reads in the correction hot paths slot lookups and keeps large
+    material collections (parameter sweeps, Monte Carlo) compact.
+
+    Args:
+        ultimate_tensile_strength: Ultimate tensile strength.
+        yield_strength: Yield strength.
+        elastic_modulus: Elastic (Young's) modulus.
+        poisson_ratio: Poisson's ratio.
+        fatigue_strength_coefficient: Fatigue strength coefficient used by
+            the Morrow correction. Optional.
+        shear_modulus: Shear modulus. Derived from the elastic modulus and
+            Poisson's ratio at construction when not given.
+    """
+
+    ultimate_tensile_strength: float
+    yield_strength: float
+    elastic_modulus: float
+    poisson_ratio: float
+    fatigue_strength_coefficient: float | None = None
+    shear_modulus: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the material constants and derive the shear modulus.
+
+        The all-valid case — the only one bulk constructors (parameter
+        sweeps, Monte Carlo sampling) ever hit — pays a single combined
+        comparison instead of four separate raise branches; the offending
+        field is looked up only on the error path.
+        """
+        if (
+            self.ultimate_tensile_strength <= 0
+            or self.yield_strength <= 0
+            or self.elastic_modulus <= 0
+            or self.poisson_ratio <= 0
+        ):
+            for attr, label in _POSITIVE_FIELDS:
+                if getattr(self, attr) <= 0:
+                    raise ValueError(f"{label} must be positive.")
+        if self.shear_modulus is None:
+            object.__setattr__(
+                self,
+                "shear_modulus",
+                self.elastic_modulus / (2.0 * (1.0 + self.poisson_ratio)),
+            )
+
+    def calc_shear_modulus(self) -> float:
+        """Return the shear modulus.
+
+        Kept for callers of the previous lazy API; the value is already
+        derived at construction.
+
+        Returns:
+            The shear modulus.
+        """
+        return cast(float, self.shear_modulus)
@@ -0,0 +1,265 @@
+"""Tests for the stress-life mean stress correction methods."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from fatpy.core.stress_life import correction_methods as cm
+from fatpy.data_parsing.material import MaterialProperties
+
+UTS = 400.0
+SF = 900.0
+
+AMPLITUDE = np.array([100.0, 80.0, 50.0, 120.0])
+MEAN = np.array([-50.0, 200.0, 0.0, 100.0])
+
+
+@pytest.fixture
+def material() -> MaterialProperties:
+    """Material with every constant the corrections consume."""
+    return MaterialProperties(
+        ultimate_tensile_strength=UTS,
+        yield_strength=250.0,
+        elastic_modulus=210e3,
+        poisson_ratio=0.3,
+        fatigue_strength_coefficient=SF,
+    )
+
+
+def _goodman_reference(
+    amplitude: np.ndarray, mean: np.ndarray, strength: float
+) -> np.ndarray:
+    """Textbook Goodman correction, written independently of the module."""
+    return np.where(mean <= 0, amplitude, amplitude / (1.0 - mean / strength))
+
+
+def _gerber_reference(
+    amplitude: np.ndarray, mean: np.ndarray, strength: float
+) -> np.ndarray:
+    """Textbook Gerber correction."""
+    return np.where(mean <= 0, amplitude, amplitude / (1.0 - (mean / strength) ** 2))
+
+
+def _swt_reference(amplitude: np.ndarray, mean: np.ndarray) -> np.ndarray:
+    """Textbook Smith-Watson-Topper correction."""
+    max_stress = mean + amplitude
+    return np.where(
+        max_stress <= 0, amplitude, np.sqrt(np.maximum(max_stress, 0.0) * amplitude)
+    )
+
+
+def test_goodman_reference_values() -> None:
+    """Goodman matches the textbook formula on mixed mean stresses."""
+    result = cm.calc_goodman_eq_stress(AMPLITUDE, MEAN, UTS)
+    np.testing.assert_allclose(result, _goodman_reference(AMPLITUDE, MEAN, UTS))
+
+
+def test_gerber_reference_values() -> None:
+    """Gerber matches the textbook formula on mixed mean stresses."""
+    result = cm.calc_gerber_eq_stress(AMPLITUDE, MEAN, UTS)
+    np.testing.assert_allclose(result, _gerber_reference(AMPLITUDE, MEAN, UTS))
+
+
+def test_morrow_reference_values() -> None:
+    """Morrow matches the Goodman form with the fatigue strength coefficient."""
+    result = cm.calc_morrow_eq_stress(AMPLITUDE, MEAN, SF)
+    np.testing.assert_allclose(result, _goodman_reference(AMPLITUDE, MEAN, SF))
+
+
+def test_swt_reference_values() -> None:
+    """SWT matches the textbook formula, including compressive maxima."""
+    amplitude = np.array([100.0, 80.0, 50.0])
+    mean = np.array([-300.0, 200.0, -50.0])
+    result = cm.calc_swt_eq_stress(amplitude, mean)
+    np.testing.assert_allclose(result, _swt_reference(amplitude, mean))
+
+
+def test_swt_compressive_points_do_not_warn() -> None:
+    """SWT stays warning-free when some maxima are compressive."""
+    amplitude = np.array([100.0, 80.0])
+    mean = np.array([-300.0, 200.0])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        cm.calc_swt_eq_stress(amplitude, mean)
+        cm.swt_ufunc(amplitude, mean)
+
+
+def test_ufunc_variants_match_calc_functions() -> None:
+    """The elementwise ufunc backend agrees with the array entry points."""
+    np.testing.assert_allclose(
+        cm.goodman_ufunc(AMPLITUDE, MEAN, UTS),
+        cm.calc_goodman_eq_stress(AMPLITUDE, MEAN, UTS),
+    )
+    np.testing.assert_allclose(
+        cm.gerber_ufunc(AMPLITUDE, MEAN, UTS),
+        cm.calc_gerber_eq_stress(AMPLITUDE, MEAN, UTS),
+    )
+    np.testing.assert_allclose(
+        cm.morrow_ufunc(AMPLITUDE, MEAN, SF),
+        cm.calc_morrow_eq_stress(AMPLITUDE, MEAN, SF),
+    )
+    np.testing.assert_allclose(
+        cm.swt_ufunc(AMPLITUDE, MEAN),
+        cm.calc_swt_eq_stress(AMPLITUDE, MEAN),
+    )
+
+
+def test_fused_all_corrections_matches_individual(
+    material: MaterialProperties,
+) -> None:
+    """The fused four-output pass agrees with the single corrections."""
+    results = cm.compute_all_corrections(AMPLITUDE, MEAN, material)
+    assert set(results) == {"goodman", "gerber", "swt", "morrow"}
+    np.testing.assert_allclose(
+        results["goodman"], cm.calc_goodman_eq_stress(AMPLITUDE, MEAN, UTS)
+    )
+    np.testing.assert_allclose(
+        results["gerber"], cm.calc_gerber_eq_stress(AMPLITUDE, MEAN, UTS)
+    )
+    np.testing.assert_allclose(results["swt"], cm.calc_swt_eq_stress(AMPLITUDE, MEAN))
+    np.testing.assert_allclose(
+        results["morrow"], cm.calc_morrow_eq_stress(AMPLITUDE, MEAN, SF)
+    )
+
+
+def test_all_corrections_requires_fatigue_coefficient() -> None:
+    """The fused pass rejects materials without a fatigue coefficient."""
+    material = MaterialProperties(UTS, 250.0, 210e3, 0.3)
+    with pytest.raises(ValueError, match="fatigue strength coefficient"):
+        cm.compute_all_corrections(AMPLITUDE, MEAN, material)
+
+
+def test_registry_matches_classes(material: MaterialProperties) -> None:
+    """Registry functions and the class interface give identical results."""
+    classes = {
+        "goodman": cm.GoodmanCorrection(),
+        "gerber": cm.GerberCorrection(),
+        "swt": cm.SWTCorrection(),
+        "morrow": cm.MorrowCorrection(),
+    }
+    for name, instance in classes.items():
+        np.testing.assert_allclose(
+            cm.CORRECTIONS[name](AMPLITUDE, MEAN, material),
+            instance.eq_stress_amplitude(AMPLITUDE, MEAN, material),
+        )
+
+
+def test_factories_match_calc_functions() -> None:
+    """Material-specialized closures agree with the generic entry points."""
+    np.testing.assert_allclose(
+        cm.make_goodman_correction(UTS)(AMPLITUDE, MEAN),
+        cm.calc_goodman_eq_stress(AMPLITUDE, MEAN, UTS),
+    )
+    np.testing.assert_allclose(
+        cm.make_gerber_correction(UTS)(AMPLITUDE, MEAN),
+        cm.calc_gerber_eq_stress(AMPLITUDE, MEAN, UTS),
+    )
+
+
+def test_make_correction_by_name() -> None:
+    """The name-based factory covers all four corrections."""
+    np.testing.assert_allclose(
+        cm.make_correction("goodman", UTS)(AMPLITUDE, MEAN),
+        cm.calc_goodman_eq_stress(AMPLITUDE, MEAN, UTS),
+    )
+    np.testing.assert_allclose(
+        cm.make_correction("swt")(AMPLITUDE, MEAN),
+        cm.calc_swt_eq_stress(AMPLITUDE, MEAN),
+    )
+    morrow = cm.make_correction("morrow", fatigue_strength_coefficient=SF)
+    np.testing.assert_allclose(
+        morrow(AMPLITUDE, MEAN), cm.calc_morrow_eq_stress(AMPLITUDE, MEAN, SF)
+    )
+
+
+def test_make_correction_errors() -> None:
+    """The name-based factory rejects unknown kinds and missing constants."""
+    with pytest.raises(ValueError, match="Unknown correction kind"):
+        cm.make_correction("walker")
+    with pytest.raises(ValueError, match="tensile strength"):
+        cm.make_correction("goodman")
+    with pytest.raises(ValueError, match="fatigue strength coefficient"):
+        cm.make_correction("morrow")
+
+
+def test_float32_inputs_are_preserved(material: MaterialProperties) -> None:
+    """Float32 cycle data keeps its dtype through every entry point."""
+    amplitude = AMPLITUDE.astype(np.float32)
+    mean = MEAN.astype(np.float32)
+    assert cm.calc_goodman_eq_stress(amplitude, mean, UTS).dtype == np.float32
+    assert cm.calc_gerber_eq_stress(amplitude, mean, UTS).dtype == np.float32
+    assert cm.calc_morrow_eq_stress(amplitude, mean, SF).dtype == np.float32
+    assert cm.calc_swt_eq_stress(amplitude, mean).dtype == np.float32
+    results = cm.compute_all_corrections(amplitude, mean, material)
+    assert all(values.dtype == np.float32 for values in results.values())
+
+
+def test_integer_inputs_promote_to_float64() -> None:
+    """Non-floating inputs run the corrections in float64."""
+    result = cm.calc_swt_eq_stress(np.array([1, 2]), np.array([1, 2]))
+    assert result.dtype == np.float64
+
+
+def test_scalar_mean_fast_path() -> None:
+    """A scalar mean stress gives the same result as the full array."""
+    full = np.full_like(AMPLITUDE, 100.0)
+    np.testing.assert_allclose(
+        cm.calc_goodman_eq_stress(AMPLITUDE, 100.0, UTS),
+        cm.calc_goodman_eq_stress(AMPLITUDE, full, UTS),
+    )
+    np.testing.assert_allclose(
+        cm.calc_gerber_eq_stress(AMPLITUDE, 100.0, UTS),
+        cm.calc_gerber_eq_stress(AMPLITUDE, full, UTS),
+    )
+    np.testing.assert_allclose(
+        cm.calc_morrow_eq_stress(AMPLITUDE, 100.0, SF),
+        cm.calc_morrow_eq_stress(AMPLITUDE, full, SF),
+    )
+
+
+def test_nonpositive_means_pass_through_unchanged() -> None:
+    """Compressive means return the amplitudes as-is, by reference."""
+    mean = np.array([-50.0, 0.0, -200.0, -1.0])
+    assert cm.calc_goodman_eq_stress(AMPLITUDE, mean, UTS) is AMPLITUDE
+    assert cm.calc_gerber_eq_stress(AMPLITUDE, -10.0, UTS) is AMPLITUDE
+    assert cm.calc_morrow_eq_stress(AMPLITUDE, 0.0, SF) is AMPLITUDE
+
+
+def test_broadcastable_shapes_are_accepted() -> None:
+    """A column mean broadcasts against a cycle matrix once at the boundary."""
+    amplitude = np.linspace(50.0, 120.0, 8).reshape(2, 4)
+    mean = np.array([[-10.0], [200.0]])
+    result = cm.calc_goodman_eq_stress(amplitude, mean, UTS)
+    assert result.shape == (2, 4)
+    full = np.broadcast_to(mean, amplitude.shape)
+    np.testing.assert_allclose(result, _goodman_reference(amplitude, full, UTS))
+
+
+def test_incompatible_shapes_raise() -> None:
+    """Non-broadcastable inputs raise ValueError."""
+    with pytest.raises(ValueError, match="broadcastable"):
+        cm.calc_goodman_eq_stress(np.ones(3), np.ones(2), UTS)
+
+
+def test_strided_inputs_match_contiguous() -> None:
+    """Strided views produce the same result as contiguous copies."""
+    amplitude = np.linspace(10.0, 120.0, 12).reshape(3, 4)
+    mean = np.linspace(-60.0, 250.0, 24).reshape(3, 8)[:, ::2]
+    assert not mean.flags.c_contiguous
+    np.testing.assert_allclose(
+        cm.calc_goodman_eq_stress(amplitude, mean, UTS),
+        cm.calc_goodman_eq_stress(amplitude, np.ascontiguousarray(mean), UTS),
+    )
+
+
+def test_nonpositive_material_constants_raise() -> None:
+    """The entry points validate their material constant."""
+    with pytest.raises(ValueError, match="must be positive"):
+        cm.calc_goodman_eq_stress(AMPLITUDE, MEAN, 0.0)
+    with pytest.raises(ValueError, match="must be positive"):
+        cm.calc_gerber_eq_stress(AMPLITUDE, MEAN, -1.0)
+    with pytest.raises(ValueError, match="must be positive"):
+        cm.calc_morrow_eq_stress(AMPLITUDE, MEAN, 0.0)
+    with pytest.raises(ValueError, match="must be positive"):
+        cm.make_goodman_correction(-5.0)
@@ -0,0 +1,88 @@
+"""Tests for the finite element model container."""
+
+import numpy as np
+import pytest
+
+from fatpy.data_parsing.fe_model import STRESS_COMPONENTS, FEModel
+
+
+@pytest.fixture
+def stress_tensor() -> np.ndarray:
+    """Small (n, 6) stress tensor block with distinct values."""
+    return np.arange(24.0).reshape(4, 6)
+
+
+def test_from_stress_tensor_roundtrip(stress_tensor: np.ndarray) -> None:
+    """The (n, 6) layout survives the transpose to component rows and back."""
+    model = FEModel.from_stress_tensor(stress_tensor)
+    assert model.stress_components.shape == (6, 4)
+    assert model.stress_components.flags.c_contiguous
+    assert model.n_points == 4
+    np.testing.assert_array_equal(model.stress_tensor(), stress_tensor)
+
+
+def test_component_rows(stress_tensor: np.ndarray) -> None:
+    """Each named component maps to its contiguous row."""
+    model = FEModel.from_stress_tensor(stress_tensor)
+    for index, name in enumerate(STRESS_COMPONENTS):
+        np.testing.assert_array_equal(model.component(name), stress_tensor[:, index])
+    with pytest.raises(KeyError, match="Unknown stress component"):
+        model.component("rr")
+
+
+def test_shape_validation() -> None:
+    """Blocks that are not (6, n) / (n, 6) raise ValueError."""
+    with pytest.raises(ValueError, match=r"\(6, n\)"):
+        FEModel(stress_components=np.ones((5, 3)))
+    with pytest.raises(ValueError, match=r"\(n, 6\)"):
+        FEModel.from_stress_tensor(np.ones((6, 5)))
+
+
+def test_add_eq_stress_stores_by_reference(stress_tensor: np.ndarray) -> None:
+    """Results are stored under their name without copying."""
+    model = FEModel.from_stress_tensor(stress_tensor)
+    values = np.arange(4.0)
+    model.add_eq_stress("goodman", values)
+    assert model.eq_stress_results["goodman"] is values
+    with pytest.raises(ValueError, match=r"shape \(4,\)"):
+        model.add_eq_stress("bad", np.arange(3.0))
+
+
+def test_node_element_map(stress_tensor: np.ndarray) -> None:
+    """The CSR map returns every element attached to a node."""
+    connectivity = {10: [1, 2, 3], 11: [2, 3, 4], 12: [4, 5]}
+    model = FEModel.from_stress_tensor(stress_tensor)
+    model.connectivity = connectivity
+    model._build_node_element_map()
+    np.testing.assert_array_equal(np.sort(model.elements_for_node(2)), [10, 11])
+    np.testing.assert_array_equal(np.sort(model.elements_for_node(4)), [11, 12])
+    np.testing.assert_array_equal(model.elements_for_node(5), [12])
+    with pytest.raises(KeyError, match="Unknown node id"):
+        model.elements_for_node(99)
+
+
+def test_prepare_cycle_caches_extremes(stress_tensor: np.ndarray) -> None:
+    """Cycle extremes are derived once and cached on the model."""
+    model = FEModel.from_stress_tensor(stress_tensor)
+    history = np.stack([stress_tensor - 10.0, stress_tensor + 30.0])
+    model.prepare_cycle(history)
+    np.testing.assert_array_equal(model.min_stress_tensor, stress_tensor - 10.0)
+    np.testing.assert_array_equal(model.max_stress_tensor, stress_tensor + 30.0)
+    with pytest.raises(ValueError, match=r"\(t, 4, 6\)"):
+        model.prepare_cycle(np.ones((2, 3, 6)))
+
+
+def test_astype_casts_and_shares_connectivity(stress_tensor: np.ndarray) -> None:
+    """Casting creates a new model with the connectivity shared."""
+    model = FEModel.from_stress_tensor(stress_tensor)
+    model.connectivity = {10: [1, 2]}
+    cast_model = model.astype(np.float32)
+    assert cast_model.stress_components.dtype == np.float32
+    assert cast_model.connectivity is model.connectivity
+    assert cast_model.eq_stress_results == {}
+
+
+def test_float32_block_is_preserved(stress_tensor: np.ndarray) -> None:
+    """A float32 input block is stored without promotion."""
+    model = FEModel.from_stress_tensor(stress_tensor.astype(np.float32))
+    assert model.stress_components.dtype == np.float32
@@ -0,0 +1,50 @@
+"""Tests for the material properties dataclass."""
+
+import dataclasses
+
+import pytest
+
+from fatpy.data_parsing.material import MaterialProperties
+
+
+def test_shear_modulus_is_derived() -> None:
+    """The shear modulus is derived at construction when not given."""
+    material = MaterialProperties(400.0, 250.0, 210e3, 0.3)
+    expected = 210e3 / (2.0 * 1.3)
+    assert material.shear_modulus == pytest.approx(expected)
+    assert material.calc_shear_modulus() == pytest.approx(expected)
+
+
+def test_explicit_shear_modulus_is_kept() -> None:
+    """An explicitly given shear modulus is not overwritten."""
+    material = MaterialProperties(400.0, 250.0, 210e3, 0.3, shear_modulus=80e3)
+    assert material.shear_modulus == 80e3
+
+
+@pytest.mark.parametrize(
+    ("field", "message"),
+    [
+        ("ultimate_tensile_strength", "Ultimate tensile strength"),
+        ("yield_strength", "Yield strength"),
+        ("elastic_modulus", "Elastic modulus"),
+        ("poisson_ratio", "Poisson's ratio"),
+    ],
+)
+def test_nonpositive_constants_raise(field: str, message: str) -> None:
+    """Each non-positive constant raises and names the offending field."""
+    kwargs = {
+        "ultimate_tensile_strength": 400.0,
+        "yield_strength": 250.0,
+        "elastic_modulus": 210e3,
+        "poisson_ratio": 0.3,
+    }
+    kwargs[field] = -1.0
+    with pytest.raises(ValueError, match=message):
+        MaterialProperties(**kwargs)
+
+
+def test_instances_are_frozen() -> None:
+    """Material properties are immutable value objects."""
+    material = MaterialProperties(400.0, 250.0, 210e3, 0.3)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        material.yield_strength = 300.0  # type: ignore[misc]
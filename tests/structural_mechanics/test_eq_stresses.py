@@ -0,0 +1,99 @@
+"""Tests for the equivalent stress criteria."""
+
+import numpy as np
+import pytest
+
+from fatpy.structural_mechanics import eq_stresses as eq
+
+
+def _uniaxial_tensor(sxx: float) -> np.ndarray:
+    """Voigt tensor with only the xx component set."""
+    return np.array([[sxx, 0.0, 0.0, 0.0, 0.0, 0.0]])
+
+
+def test_manson_mcknight_uniaxial_reference() -> None:
+    """A uniaxial cycle reduces to its scalar mean and amplitude."""
+    eq_mean, eq_amp = eq.manson_mcknight_criterion(
+        _uniaxial_tensor(-100.0), _uniaxial_tensor(300.0)
+    )
+    np.testing.assert_allclose(eq_mean, [100.0])
+    np.testing.assert_allclose(eq_amp, [200.0])
+
+
+def test_manson_mcknight_mean_carries_hydrostatic_sign() -> None:
+    """A compressive hydrostatic mean flips the equivalent mean sign."""
+    eq_mean, eq_amp = eq.manson_mcknight_criterion(
+        _uniaxial_tensor(-300.0), _uniaxial_tensor(100.0)
+    )
+    np.testing.assert_allclose(eq_mean, [-100.0])
+    np.testing.assert_allclose(eq_amp, [200.0])
+
+
+def test_manson_mcknight_chunked_matches_unchunked() -> None:
+    """Chunked streaming is bit-compatible with the whole-array pass."""
+    rng = np.random.default_rng(42)
+    max_tensor = rng.normal(scale=100.0, size=(257, 6))
+    min_tensor = max_tensor - np.abs(rng.normal(scale=50.0, size=(257, 6)))
+    whole = eq.manson_mcknight_criterion(min_tensor, max_tensor)
+    chunked = eq.manson_mcknight_criterion(min_tensor, max_tensor, chunk_size=64)
+    np.testing.assert_array_equal(whole[0], chunked[0])
+    np.testing.assert_array_equal(whole[1], chunked[1])
+
+
+def test_manson_mcknight_preserves_float32() -> None:
+    """Float32 extreme tensors produce float32 results."""
+    min_tensor = _uniaxial_tensor(-100.0).astype(np.float32)
+    max_tensor = _uniaxial_tensor(300.0).astype(np.float32)
+    eq_mean, eq_amp = eq.manson_mcknight_criterion(min_tensor, max_tensor)
+    assert eq_mean.dtype == np.float32
+    assert eq_amp.dtype == np.float32
+
+
+def test_manson_mcknight_validation() -> None:
+    """Bad shapes and chunk sizes raise ValueError."""
+    tensor = _uniaxial_tensor(100.0)
+    with pytest.raises(ValueError, match=r"\(n, 6\)"):
+        eq.manson_mcknight_criterion(np.ones((2, 5)), np.ones((2, 5)))
+    with pytest.raises(ValueError, match=r"\(n, 6\)"):
+        eq.manson_mcknight_criterion(tensor, np.ones((2, 6)))
+    with pytest.raises(ValueError, match="Chunk size"):
+        eq.manson_mcknight_criterion(tensor, tensor, chunk_size=0)
+
+
+def test_dang_van_pure_shear() -> None:
+    """Pure shear has zero hydrostatic part and sqrt(J2) equal to the shear."""
+    tensor = np.array([[0.0, 0.0, 0.0, 80.0, 0.0, 0.0]])
+    result = eq.dang_van_criterion(tensor, hydrostatic_sensitivity=0.3)
+    np.testing.assert_allclose(result, [80.0])
+
+
+def test_dang_van_pure_hydrostatic() -> None:
+    """A hydrostatic state contributes only the scaled hydrostatic term."""
+    tensor = np.array([[120.0, 120.0, 120.0, 0.0, 0.0, 0.0]])
+    result = eq.dang_van_criterion(tensor, hydrostatic_sensitivity=0.3)
+    np.testing.assert_allclose(result, [0.3 * 120.0])
+
+
+def test_dang_van_validation() -> None:
+    """Tensors without six components raise ValueError."""
+    with pytest.raises(ValueError, match=r"\(n, 6\)"):
+        eq.dang_van_criterion(np.ones((3, 4)), 0.3)
+
+
+def test_cycle_extremes_per_point_and_component() -> None:
+    """Extremes are reduced over load steps only, keeping point data."""
+    history = np.zeros((3, 2, 6))
+    history[:, 0, 0] = [-50.0, 200.0, 100.0]
+    history[:, 1, 3] = [30.0, -10.0, 20.0]
+    min_tensor, max_tensor = eq.cycle_extremes(history)
+    assert min_tensor.shape == (2, 6)
+    assert min_tensor[0, 0] == -50.0
+    assert max_tensor[0, 0] == 200.0
+    assert min_tensor[1, 3] == -10.0
+    assert max_tensor[1, 3] == 30.0
+
+
+def test_cycle_extremes_validation() -> None:
+    """Histories that are not (t, n, 6) raise ValueError."""
+    with pytest.raises(ValueError, match=r"\(t, n, 6\)"):
+        eq.cycle_extremes(np.ones((3, 6)))